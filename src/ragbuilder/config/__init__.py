@@ -1,7 +1,7 @@
 from .data_ingest import DataIngestConfig, DataIngestOptionsConfig
 from .retriever import RetrievalConfig, RetrievalOptionsConfig, BaseRetrieverConfig, RerankerConfig
 from .generation import GenerationConfig, GenerationOptionsConfig
-from .base import LogConfig, LLMConfig, EmbeddingConfig, EvalDataGenerationConfig, OptimizationConfig
+from .base import LogConfig, LLMConfig, EmbeddingConfig, EvalDataGenerationConfig, OptimizationConfig, model_schema
 
 __all__ = [
     'DataIngestConfig', 
@@ -16,5 +16,6 @@ __all__ = [
     'LLMConfig',
     'EmbeddingConfig',
     'EvalDataGenerationConfig',
-    'OptimizationConfig'
+    'OptimizationConfig',
+    'model_schema'
 ]
\ No newline at end of file
@@ -1,16 +1,48 @@
 import inspect
-import time
-import random
-import logging
+import mmap
+import os
+import yaml
+try:
+    # libyaml-backed C implementations are ~5-10x faster than the pure-Python ones
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
 from pydantic import BaseModel, Field, PrivateAttr
-from typing import Optional, Dict, Any, Union
+from typing import Literal, Optional, Dict, Any, Type, Union
 from dataclasses import dataclass
-from .components import EvaluatorType, LLMType, LLM_MAP, EmbeddingType, EMBEDDING_MAP
+from functools import lru_cache
+# Only the enums at module level: importing the component maps here would
+# materialize them via components.__getattr__ on every config import path
+from .components import EvaluatorType, LLMType, EmbeddingType
 from langchain_core.language_models import BaseChatModel, BaseLLM
 from langchain_core.embeddings import Embeddings
 
+# Below this size the mmap setup overhead outweighs the copy it avoids
+_MMAP_THRESHOLD = 8 * 1024
+
+def _read_yaml(file_path: str) -> Dict[str, Any]:
+    """Parse a YAML config file once using the fastest available loader.
+
+    Large files are memory-mapped so libyaml consumes the bytes without an
+    intermediate in-memory copy of the whole document.
+    """
+    if os.path.getsize(file_path) < _MMAP_THRESHOLD:
+        with open(file_path, 'r') as file:
+            return yaml.load(file, Loader=YamlLoader)
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return yaml.load(mm, Loader=YamlLoader)
+
+@lru_cache(maxsize=None)
+def model_schema(model_cls: Type[BaseModel]) -> Dict[str, Any]:
+    """Return the JSON schema for a config model, built once per class.
+
+    Schema generation walks the whole model tree, so UI/OpenAPI callers
+    should go through this instead of calling model_json_schema directly.
+    """
+    return model_cls.model_json_schema()
+
 class LLMConfig(BaseModel):
-    model_config = {"protected_namespaces": (), "arbitrary_types_allowed": True}
+    model_config = {"protected_namespaces": (), "arbitrary_types_allowed": True, "frozen": True}
     
     type: Optional[LLMType] = None  # Enum to specify the LLM
     model_kwargs: Optional[Dict[str, Any]] = Field(default=None, description="Model-specific parameters like model name/type")
@@ -24,7 +56,8 @@ class LLMConfig(BaseModel):
         
         if not self.type:
             raise ValueError("Cannot initialize LLM without type")
-            
+
+        from .components import LLM_MAP
         llm_class = LLM_MAP[self.type]()
         return llm_class(**(self.model_kwargs or {}))
 
@@ -34,11 +67,16 @@ class LLMConfig(BaseModel):
         return cls.model_construct(_initialized_llm=llm)
 
 class EmbeddingConfig(BaseModel):
-    model_config = {"protected_namespaces": (), "arbitrary_types_allowed": True}
+    model_config = {"protected_namespaces": (), "arbitrary_types_allowed": True, "frozen": True}
     
     type: Optional[EmbeddingType] = None
     model_kwargs: Optional[Dict[str, Any]] = None
     custom_class: Optional[str] = None
+    batch_size: Optional[int] = Field(default=None, description="Chunks to embed per embed_documents call (None keeps the provider default)")
+    dtype: Optional[Literal["fp32", "fp16", "bf16"]] = Field(
+        default=None,
+        description="Model precision for local embedding models (None uses the provider default)"
+    )
     _initialized_embedding: Optional[Embeddings] = PrivateAttr(default=None)
 
     @property
@@ -46,12 +84,36 @@ class EmbeddingConfig(BaseModel):
         """Get initialized Embedding instance"""
         if self._initialized_embedding:
             return self._initialized_embedding
-        
+
         if not self.type:
             raise ValueError("Cannot initialize Embedding without type")
-            
+
+        from .components import EMBEDDING_MAP
         embedding_class = EMBEDDING_MAP[self.type]()
-        return embedding_class(**(self.model_kwargs or {}))
+        return embedding_class(**self._build_kwargs())
+
+    def _build_kwargs(self) -> Dict[str, Any]:
+        """Merge model_kwargs with the batch-size knob for providers that support it."""
+        kwargs = dict(self.model_kwargs or {})
+        if self.type == EmbeddingType.HUGGINGFACE:
+            encode_kwargs = dict(kwargs.get("encode_kwargs") or {})
+            encode_kwargs.setdefault("batch_size", self.batch_size or 64)
+            kwargs["encode_kwargs"] = encode_kwargs
+        elif self.batch_size and self.type in (EmbeddingType.OPENAI, EmbeddingType.AZURE_OPENAI):
+            # OpenAIEmbeddings calls its batch size chunk_size; its default
+            # (1000) is already well-batched, so only set it when asked
+            kwargs.setdefault("chunk_size", self.batch_size)
+        if self.dtype and self.type == EmbeddingType.HUGGINGFACE:
+            from .components import TORCH_DTYPE_MAP
+            # SentenceTransformer has no torch_dtype parameter itself; it only
+            # forwards its *inner* model_kwargs dict to transformers, so the
+            # dtype has to sit two levels deep.
+            model_kwargs = dict(kwargs.get("model_kwargs") or {})
+            inner_kwargs = dict(model_kwargs.get("model_kwargs") or {})
+            inner_kwargs.setdefault("torch_dtype", TORCH_DTYPE_MAP[self.dtype])
+            model_kwargs["model_kwargs"] = inner_kwargs
+            kwargs["model_kwargs"] = model_kwargs
+        return kwargs
 
     @classmethod
     def from_embedding(cls, embedding: Embeddings) -> 'EmbeddingConfig':
@@ -99,6 +161,8 @@ class OptimizationConfig(BaseModel):
                         break
                 frame = frame.f_back
                 
+            import time
+            import random
             timestamp = int(time.time()*1000 + random.randint(1, 1000))
             self.study_name = f"{caller_module}_{timestamp}"
 
@@ -110,14 +174,14 @@ class EvaluationConfig(BaseModel):
     embeddings: Optional[Any] = Field(default=None, description="Embedding configuration")
     eval_data_generation_config: Optional[EvalDataGenerationConfig] = Field(default=None, description="Evaluation data generation configuration")
     evaluator_kwargs: Optional[Dict[str, Any]] = Field(
-        default = {},
+        default_factory=dict,
         description="Additional parameters for evaluator initialization"
     )
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LogConfig:
     """Configuration for logging"""
-    log_level: int = logging.INFO
+    log_level: int = 20  # logging.INFO, hardcoded so importing this module doesn't need logging
     log_file: Optional[str] = None
     show_progress_bar: bool = True
     verbose: bool = False
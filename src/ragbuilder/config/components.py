@@ -1,29 +1,72 @@
-from typing import Callable
+import sys
+from typing import Callable, NamedTuple, Tuple
 from enum import Enum
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:  # pragma: no cover - fallback for older interpreters
+    class StrEnum(str, Enum):
+        __str__ = str.__str__
+from functools import cache
 from importlib import import_module
+from importlib.util import find_spec
 from dataclasses import dataclass
 
-@dataclass
+@cache
+def _has_module(import_name: str) -> bool:
+    """Check whether a module is installed without executing its top-level code."""
+    try:
+        return find_spec(import_name) is not None
+    except (ImportError, ModuleNotFoundError, ValueError):
+        return False
+
+@dataclass(frozen=True, slots=True)
 class _PkgSpec:
     install_name: str
     import_name: str = ""
-    
+
     def __post_init__(self):
         if not self.import_name:
-            self.import_name = self.install_name.replace("-", "_")
+            object.__setattr__(self, "import_name", self.install_name.replace("-", "_"))
 
     def validate(self) -> str:
-        try:
-            import_module(self.import_name)
-            return ""
-        except (ImportError, ModuleNotFoundError):
-            return self.install_name
+        return "" if _has_module(self.import_name) else self.install_name
+
+# Shared _PkgSpec singletons for packages referenced by multiple components,
+# so the env-requirements table doesn't allocate duplicate specs.
+_PKG_LANGCHAIN_OPENAI = _PkgSpec("langchain-openai", "langchain_openai")
+_PKG_OPENAI = _PkgSpec("openai")
+_PKG_TIKTOKEN = _PkgSpec("tiktoken")
+_PKG_COHERE = _PkgSpec("cohere")
+_PKG_LANGCHAIN_VERTEXAI = _PkgSpec("langchain-google-vertexai", "langchain_google_vertexai")
+_PKG_AIPLATFORM = _PkgSpec("google-cloud-aiplatform", "google.cloud.aiplatform")
+_PKG_BOTO3 = _PkgSpec("boto3")
+_PKG_JINA = _PkgSpec("jina")
+_PKG_LANGCHAIN_HUGGINGFACE = _PkgSpec("langchain-huggingface", "langchain_huggingface")
+_PKG_SENTENCE_TRANSFORMERS = _PkgSpec("sentence-transformers", "sentence_transformers")
+_PKG_TORCH = _PkgSpec("torch")
+_PKG_TRANSFORMERS = _PkgSpec("transformers")
+_PKG_LANGCHAIN_OLLAMA = _PkgSpec("langchain-ollama", "langchain_ollama")
+_PKG_OLLAMA = _PkgSpec("ollama")
+
+# Short dtype names accepted by config knobs -> torch dtype strings understood
+# by transformers/sentence-transformers/rerankers constructors.
+TORCH_DTYPE_MAP = {
+    "fp32": "float32",
+    "fp16": "float16",
+    "bf16": "bfloat16",
+}
+
+class EnvReq(NamedTuple):
+    """Environment variable and package requirements for a component."""
+    required: Tuple[str, ...] = ()
+    optional: Tuple[str, ...] = ()
+    packages: Tuple[_PkgSpec, ...] = ()
 
 # Component type definitions
-class GraphType(str, Enum):
+class GraphType(StrEnum):
     NEO4J = "neo4j"
     
-class LLMType(str, Enum):
+class LLMType(StrEnum):
     OPENAI = "openai"
     AZURE_OPENAI = "azure_openai"
     HUGGINGFACE = "huggingface"
@@ -34,7 +77,7 @@ class LLMType(str, Enum):
     JINA = "jina"
     CUSTOM = "custom"
 
-class ParserType(str, Enum):
+class ParserType(StrEnum):
     TEXT = "text"
     UNSTRUCTURED = "unstructured"
     PYMUPDF = "pymupdf"
@@ -46,7 +89,7 @@ class ParserType(str, Enum):
     WEB = "web"
     CUSTOM = "custom"
 
-class ChunkingStrategy(str, Enum):
+class ChunkingStrategy(StrEnum):
     CHARACTER = "CharacterTextSplitter"
     RECURSIVE = "RecursiveCharacterTextSplitter"
     TOKEN = "TokenTextSplitter"
@@ -62,7 +105,7 @@ NO_CHUNK_SIZE_STRATEGIES = [
     ChunkingStrategy.CUSTOM
 ]
 
-class EmbeddingType(str, Enum):
+class EmbeddingType(StrEnum):
     OPENAI = "openai"
     AZURE_OPENAI = "azure_openai"
     HUGGINGFACE = "huggingface"
@@ -73,7 +116,7 @@ class EmbeddingType(str, Enum):
     JINA = "jina"
     CUSTOM = "custom"
 
-class VectorDatabase(str, Enum):
+class VectorDatabase(StrEnum):
     FAISS = "faiss"
     CHROMA = "chroma"
     PINECONE = "pinecone"
@@ -84,7 +127,7 @@ class VectorDatabase(str, Enum):
     ELASTICSEARCH = "elasticsearch"
     CUSTOM = "custom"
 
-class RetrieverType(str, Enum):
+class RetrieverType(StrEnum):
     VECTOR_SIMILARITY = "vector_similarity"
     VECTOR_MMR = "vector_mmr"
     MULTI_QUERY = "multi_query"
@@ -94,7 +137,7 @@ class RetrieverType(str, Enum):
     GRAPH_RETRIEVER = "graph"
     CUSTOM = "custom"
 
-class RerankerType(str, Enum):
+class RerankerType(StrEnum):
     MXBAI_LARGE = "mixedbread-ai/mxbai-rerank-large-v1"
     MXBAI_BASE = "mixedbread-ai/mxbai-rerank-base-v1"
     BGE_BASE = "BAAI/bge-reranker-base"
@@ -105,416 +148,331 @@ class RerankerType(str, Enum):
     RANKLLM = "rankllm"
     CUSTOM = "custom"
 
-class EvaluatorType(str, Enum):
+class EvaluatorType(StrEnum):
     SIMILARITY = "similarity"
     RAGAS = "ragas"
     CUSTOM = "custom"
 
+@cache
+def _resolve(module_path: str, class_name: str):
+    """Import and resolve a class, caching the result per (module, class) pair."""
+    try:
+        # Dynamically import the module
+        module = import_module(module_path)
+        # Get the class from the module
+        return getattr(module, class_name)
+    except Exception as e:
+        raise ValueError(f"Error loading {class_name} from module {module_path}: {e}")
+
+class _LazyClass:
+    """Lazily resolved reference to a class in a possibly-unimported module.
+
+    Calling the proxy returns the resolved class (the historic lazy_load
+    contract, so `MAP[key]()` call sites keep working), and attribute access
+    forwards to the class so it can also be used directly. Resolution happens
+    once and is cached on the proxy (and shared via _resolve's cache).
+    """
+    __slots__ = ("_module_path", "_class_name", "_cls", "_err")
+
+    def __init__(self, module_path: str, class_name: str):
+        self._module_path = module_path
+        self._class_name = class_name
+        self._cls = None
+        self._err = None
+
+    def _load(self):
+        if self._cls is None:
+            # Re-raise the cached failure rather than re-running the import
+            # machinery and rebuilding the message on every retry
+            if self._err is not None:
+                raise self._err
+            try:
+                self._cls = _resolve(self._module_path, self._class_name)
+            except ValueError as e:
+                self._err = e
+                raise
+        return self._cls
+
+    def __call__(self):
+        return self._cls if self._cls is not None else self._load()
+
+    def get_class(self):
+        """Backward-compatible accessor for the resolved class."""
+        return self._load()
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __repr__(self):
+        return f"<lazy class {self._module_path}.{self._class_name}>"
+
 def lazy_load(module_path: str, class_name: str) -> Callable:
-    """Lazy loader function that imports a class only when needed."""
-    # def get_class():
-    #     module = import_module(module_path)
-    #     return getattr(module, class_name)
-    # return get_class
-    def get_class():
-        try:
-            # Dynamically import the module
-            module = import_module(module_path)
-            # Get the class from the module
-            return getattr(module, class_name)
-        except Exception as e:
-            raise ValueError(f"Error loading {class_name} from module {module_path}: {e}")
-    return get_class
-
-
-# Component mappings with lazy loading
-LLM_MAP = {
-    LLMType.OPENAI: lazy_load("langchain_openai", "ChatOpenAI"),
-    LLMType.AZURE_OPENAI: lazy_load("langchain_openai", "AzureChatOpenAI"),
-    LLMType.HUGGINGFACE: lazy_load("langchain_huggingface", "HuggingFaceEndpoint"),
-    LLMType.OLLAMA: lazy_load("langchain_ollama", "OllamaChat"),
-    LLMType.COHERE: lazy_load("langchain_community.llms", "Cohere"),
-    LLMType.VERTEXAI: lazy_load("langchain_google_vertexai", "VertexAI"),
-    LLMType.BEDROCK: lazy_load("langchain_community.llms", "Bedrock"),
-    LLMType.JINA: lazy_load("langchain_community.llms", "Jina"),
-}
+    """Lazy loader that resolves a class only when needed."""
+    return _LazyClass(module_path, class_name)
 
-LOADER_MAP = {
-    # ParserType.UNSTRUCTURED: lazy_load("langchain_unstructured", "UnstructuredLoader"),
-    ParserType.TEXT: lazy_load("langchain.document_loaders", "TextLoader"),
-    ParserType.UNSTRUCTURED: lazy_load("langchain_community.document_loaders", "UnstructuredFileLoader"),
-    ParserType.PYMUPDF: lazy_load("langchain_community.document_loaders", "PyMuPDFLoader"),
-    ParserType.PYPDF: lazy_load("langchain_community.document_loaders", "PyPDFLoader"),
-    ParserType.DOCX: lazy_load("langchain_community.document_loaders", "Docx2txtLoader"),
-    ParserType.AZURE_BLOB: lazy_load("langchain_community.document_loaders", "AzureBlobStorageContainerLoader"),
-    ParserType.S3: lazy_load("langchain_community.document_loaders", "S3DirectoryLoader"),
-    ParserType.DIRECTORY: lazy_load("langchain_community.document_loaders", "DirectoryLoader"),
-    ParserType.WEB: lazy_load("langchain_community.document_loaders", "WebBaseLoader"),
-}
 
-CHUNKER_MAP = {
-    ChunkingStrategy.CHARACTER: lazy_load("langchain_text_splitters", "CharacterTextSplitter"),
-    ChunkingStrategy.RECURSIVE: lazy_load("langchain_text_splitters", "RecursiveCharacterTextSplitter"),
-    ChunkingStrategy.TOKEN: lazy_load("langchain_text_splitters", "TokenTextSplitter"),
-    ChunkingStrategy.MARKDOWN: lazy_load("langchain_text_splitters", "MarkdownHeaderTextSplitter"),
-    ChunkingStrategy.HTML: lazy_load("langchain_text_splitters", "HTMLHeaderTextSplitter"),
-    ChunkingStrategy.SEMANTIC: lazy_load("langchain_experimental.text_splitter", "SemanticChunker"),
-}
+# Component mappings with lazy loading.
+# The maps (and COMPONENT_ENV_REQUIREMENTS) are materialized on first attribute
+# access via the module-level __getattr__ below, so consumers that only import
+# the enums never pay for building them.
+def _build_llm_map():
+    return {
+        LLMType.OPENAI: lazy_load("langchain_openai", "ChatOpenAI"),
+        LLMType.AZURE_OPENAI: lazy_load("langchain_openai", "AzureChatOpenAI"),
+        LLMType.HUGGINGFACE: lazy_load("langchain_huggingface", "HuggingFaceEndpoint"),
+        LLMType.OLLAMA: lazy_load("langchain_ollama", "OllamaChat"),
+        LLMType.COHERE: lazy_load("langchain_community.llms", "Cohere"),
+        LLMType.VERTEXAI: lazy_load("langchain_google_vertexai", "VertexAI"),
+        LLMType.BEDROCK: lazy_load("langchain_community.llms", "Bedrock"),
+        LLMType.JINA: lazy_load("langchain_community.llms", "Jina"),
+    }
 
-EMBEDDING_MAP = {
-    EmbeddingType.OPENAI: lazy_load("langchain_openai", "OpenAIEmbeddings"),
-    EmbeddingType.AZURE_OPENAI: lazy_load("langchain_openai", "AzureOpenAIEmbeddings"),
-    EmbeddingType.HUGGINGFACE: lazy_load("langchain_huggingface", "HuggingFaceEmbeddings"),
-    EmbeddingType.OLLAMA: lazy_load("langchain_community.embeddings", "OllamaEmbeddings"),
-    EmbeddingType.COHERE: lazy_load("langchain_community.embeddings", "CohereEmbeddings"),
-    EmbeddingType.VERTEXAI: lazy_load("langchain_community.embeddings", "VertexAIEmbeddings"),
-    EmbeddingType.BEDROCK: lazy_load("langchain_community.embeddings", "BedrockEmbeddings"),
-    EmbeddingType.JINA: lazy_load("langchain_community.embeddings", "JinaEmbeddings"),
-}
+def _build_loader_map():
+    return {
+        # ParserType.UNSTRUCTURED: lazy_load("langchain_unstructured", "UnstructuredLoader"),
+        ParserType.TEXT: lazy_load("langchain.document_loaders", "TextLoader"),
+        ParserType.UNSTRUCTURED: lazy_load("langchain_community.document_loaders", "UnstructuredFileLoader"),
+        ParserType.PYMUPDF: lazy_load("langchain_community.document_loaders", "PyMuPDFLoader"),
+        ParserType.PYPDF: lazy_load("langchain_community.document_loaders", "PyPDFLoader"),
+        ParserType.DOCX: lazy_load("langchain_community.document_loaders", "Docx2txtLoader"),
+        ParserType.AZURE_BLOB: lazy_load("langchain_community.document_loaders", "AzureBlobStorageContainerLoader"),
+        ParserType.S3: lazy_load("langchain_community.document_loaders", "S3DirectoryLoader"),
+        ParserType.DIRECTORY: lazy_load("langchain_community.document_loaders", "DirectoryLoader"),
+        ParserType.WEB: lazy_load("langchain_community.document_loaders", "WebBaseLoader"),
+    }
 
-VECTORDB_MAP = {
-    VectorDatabase.FAISS: lazy_load("langchain_community.vectorstores", "FAISS"),
-    VectorDatabase.CHROMA: lazy_load("langchain_chroma", "Chroma"),
-    VectorDatabase.PINECONE: lazy_load("langchain_pinecone", "PineconeVectorStore"),
-    VectorDatabase.WEAVIATE: lazy_load("langchain_weaviate.vectorstores", "WeaviateVectorStore"),
-    VectorDatabase.QDRANT: lazy_load("langchain_qdrant", "QdrantVectorStore"),
-    VectorDatabase.MILVUS: lazy_load("langchain_milvus", "Milvus"),
-    VectorDatabase.PGVECTOR: lazy_load("langchain_postgres", "PGVector"),
-    VectorDatabase.ELASTICSEARCH: lazy_load("langchain-elasticsearch", "ElasticsearchStore"),
-}
+def _build_chunker_map():
+    return {
+        ChunkingStrategy.CHARACTER: lazy_load("langchain_text_splitters", "CharacterTextSplitter"),
+        ChunkingStrategy.RECURSIVE: lazy_load("langchain_text_splitters", "RecursiveCharacterTextSplitter"),
+        ChunkingStrategy.TOKEN: lazy_load("langchain_text_splitters", "TokenTextSplitter"),
+        ChunkingStrategy.MARKDOWN: lazy_load("langchain_text_splitters", "MarkdownHeaderTextSplitter"),
+        ChunkingStrategy.HTML: lazy_load("langchain_text_splitters", "HTMLHeaderTextSplitter"),
+        ChunkingStrategy.SEMANTIC: lazy_load("langchain_experimental.text_splitter", "SemanticChunker"),
+    }
 
-RETRIEVER_MAP = {
-    RetrieverType.BM25: lazy_load("langchain_community.retrievers", "BM25Retriever"),
-}
+def _build_embedding_map():
+    return {
+        EmbeddingType.OPENAI: lazy_load("langchain_openai", "OpenAIEmbeddings"),
+        EmbeddingType.AZURE_OPENAI: lazy_load("langchain_openai", "AzureOpenAIEmbeddings"),
+        EmbeddingType.HUGGINGFACE: lazy_load("langchain_huggingface", "HuggingFaceEmbeddings"),
+        EmbeddingType.OLLAMA: lazy_load("langchain_community.embeddings", "OllamaEmbeddings"),
+        EmbeddingType.COHERE: lazy_load("langchain_community.embeddings", "CohereEmbeddings"),
+        EmbeddingType.VERTEXAI: lazy_load("langchain_community.embeddings", "VertexAIEmbeddings"),
+        EmbeddingType.BEDROCK: lazy_load("langchain_community.embeddings", "BedrockEmbeddings"),
+        EmbeddingType.JINA: lazy_load("langchain_community.embeddings", "JinaEmbeddings"),
+    }
 
-RERANKER_MAP = {
-    RerankerType.MXBAI_LARGE: {
-        'model_type': 'cross-encoder',
-        'verbose': 0,
-        'lazy_load': lazy_load("rerankers", "Reranker")
-    },
-    RerankerType.MXBAI_BASE: {
-        'model_type': 'cross-encoder',
-        'verbose': 0,
-        'lazy_load': lazy_load("rerankers", "Reranker")
-    },
-    RerankerType.BGE_BASE: {
-        'model_type': 'TransformerRanker',
-        'verbose': 0,
-        'lazy_load': lazy_load("rerankers", "Reranker")
-    },
-    RerankerType.FLASH_RANK: {
-        'model_type': 'FlashRankRanker',
-        'verbose': 0,
-        'lazy_load': lazy_load("rerankers", "Reranker")
-    },
-    RerankerType.COHERE: {
-        'model_type': 'APIRanker',
-        'lang': 'en',
-        'verbose': 0,
-        'lazy_load': lazy_load("rerankers", "Reranker")
-    },
-    RerankerType.JINA: {
-        'model_type': 'APIRanker',
-        'verbose': 0,
-        'lazy_load': lazy_load("rerankers", "Reranker")
-    },
-    RerankerType.COLBERT: {
-        'model_type': 'ColBERTRanker',
-        'verbose': 0,
-        'lazy_load': lazy_load("rerankers", "Reranker")
-    },
-    RerankerType.RANKLLM: {
-        'model_type': 'RankLLMRanker',
-        'verbose': 0,
-        'lazy_load': lazy_load("rerankers", "Reranker")
-    },
-    RerankerType.CUSTOM: {
-        'lazy_load': lazy_load("rerankers", "Reranker")
+def _build_vectordb_map():
+    return {
+        VectorDatabase.FAISS: lazy_load("langchain_community.vectorstores", "FAISS"),
+        VectorDatabase.CHROMA: lazy_load("langchain_chroma", "Chroma"),
+        VectorDatabase.PINECONE: lazy_load("langchain_pinecone", "PineconeVectorStore"),
+        VectorDatabase.WEAVIATE: lazy_load("langchain_weaviate.vectorstores", "WeaviateVectorStore"),
+        VectorDatabase.QDRANT: lazy_load("langchain_qdrant", "QdrantVectorStore"),
+        VectorDatabase.MILVUS: lazy_load("langchain_milvus", "Milvus"),
+        VectorDatabase.PGVECTOR: lazy_load("langchain_postgres", "PGVector"),
+        VectorDatabase.ELASTICSEARCH: lazy_load("langchain-elasticsearch", "ElasticsearchStore"),
+    }
+
+def _build_retriever_map():
+    return {
+        RetrieverType.BM25: lazy_load("langchain_community.retrievers", "BM25Retriever"),
+    }
+
+# Single shared loader: every reranker type resolves the same `rerankers.Reranker`
+# class, so one closure (and one import) serves all entries.
+_RERANKER_LOADER = lazy_load("rerankers", "Reranker")
+
+def _build_reranker_map():
+    return {
+        RerankerType.MXBAI_LARGE: {
+            'model_type': 'cross-encoder',
+            'verbose': 0,
+            'lazy_load': _RERANKER_LOADER
+        },
+        RerankerType.MXBAI_BASE: {
+            'model_type': 'cross-encoder',
+            'verbose': 0,
+            'lazy_load': _RERANKER_LOADER
+        },
+        RerankerType.BGE_BASE: {
+            'model_type': 'TransformerRanker',
+            'verbose': 0,
+            'lazy_load': _RERANKER_LOADER
+        },
+        RerankerType.FLASH_RANK: {
+            'model_type': 'FlashRankRanker',
+            'verbose': 0,
+            'lazy_load': _RERANKER_LOADER
+        },
+        RerankerType.COHERE: {
+            'model_type': 'APIRanker',
+            'lang': 'en',
+            'verbose': 0,
+            'lazy_load': _RERANKER_LOADER
+        },
+        RerankerType.JINA: {
+            'model_type': 'APIRanker',
+            'verbose': 0,
+            'lazy_load': _RERANKER_LOADER
+        },
+        RerankerType.COLBERT: {
+            'model_type': 'ColBERTRanker',
+            'verbose': 0,
+            'lazy_load': _RERANKER_LOADER
+        },
+        RerankerType.RANKLLM: {
+            'model_type': 'RankLLMRanker',
+            'verbose': 0,
+            'lazy_load': _RERANKER_LOADER
+        },
+        RerankerType.CUSTOM: {
+            'lazy_load': _RERANKER_LOADER
+        }
     }
-}
 
 # Environment variable requirements for components
-COMPONENT_ENV_REQUIREMENTS = {
-    # Unstructured
-    ParserType.UNSTRUCTURED: {
-        "required": [],
-        "optional": [],
-        "packages": [_PkgSpec("langchain-unstructured")]
-    },
-    # Embedding Models
-    EmbeddingType.AZURE_OPENAI: {
-        "required": ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"],
-        "optional": ["AZURE_DEPLOYMENT_NAME"],
-        "packages": [
-            _PkgSpec("langchain-openai"),
-            _PkgSpec("openai"),
-            _PkgSpec("tiktoken")
-        ]
-    },
-    EmbeddingType.OPENAI: {
-        "required": ["OPENAI_API_KEY"],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-openai"),
-            _PkgSpec("openai"),
-            _PkgSpec("tiktoken")
-        ]
-    },
-    EmbeddingType.COHERE: {
-        "required": ["COHERE_API_KEY"],
-        "optional": [],
-        "packages": [_PkgSpec("cohere")]
-    },
-    EmbeddingType.VERTEXAI: {
-        "required": ["GOOGLE_APPLICATION_CREDENTIALS"],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-google-vertexai"),
-            _PkgSpec("google-cloud-aiplatform")
-        ]
-    },
-    EmbeddingType.BEDROCK: {
-        "required": ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"],
-        "optional": [],
-        "packages": [_PkgSpec("boto3")]
-    },
-    EmbeddingType.JINA: {
-        "required": ["JINA_API_KEY"],
-        "optional": [],
-        "packages": [_PkgSpec("jina")]
-    },
-    EmbeddingType.HUGGINGFACE: {
-        "required": [],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-huggingface"),
-            _PkgSpec("sentence-transformers"),
-            _PkgSpec("torch")
-        ]
-    },
-    EmbeddingType.OLLAMA: {
-        "required": [],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-ollama"),
-            _PkgSpec("ollama")
-        ]
-    },
-
-    # LLMs
-    LLMType.AZURE_OPENAI: {
-        "required": ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"],
-        "optional": ["AZURE_DEPLOYMENT_NAME"],
-        "packages": [
-            _PkgSpec("langchain-openai"),
-            _PkgSpec("openai"),
-            _PkgSpec("tiktoken")
-        ]
-    },
-    LLMType.OPENAI: {
-        "required": ["OPENAI_API_KEY"],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-openai"),
-            _PkgSpec("openai"),
-            _PkgSpec("tiktoken")
-        ]
-    },
-    LLMType.HUGGINGFACE: {
-        "required": [],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-huggingface"),
-            _PkgSpec("sentence-transformers"),
-            _PkgSpec("torch")
-        ]
-    },
-    LLMType.OLLAMA: {
-        "required": [],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-ollama"),
-            _PkgSpec("ollama")
-        ]
-    },
-    LLMType.COHERE: {
-        "required": ["COHERE_API_KEY"],
-        "optional": [],
-        "packages": [_PkgSpec("cohere")]
-    },
-    LLMType.VERTEXAI: {
-        "required": ["GOOGLE_APPLICATION_CREDENTIALS"],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-google-vertexai"),
-            _PkgSpec("google-cloud-aiplatform")
-        ]
-    },
-    LLMType.BEDROCK: {
-        "required": ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"],
-        "optional": [],
-        "packages": [_PkgSpec("boto3")]
-    },
-    LLMType.JINA: {
-        "required": ["JINA_API_KEY"],
-        "optional": [],
-        "packages": [_PkgSpec("jina")]
-    },
-    
-    # Vector Databases
-    VectorDatabase.PINECONE: {
-        "required": ["PINECONE_API_KEY", "PINECONE_ENVIRONMENT"],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-pinecone"),
-            _PkgSpec("pinecone-client", "pinecone")
-        ]
-    },
-    VectorDatabase.WEAVIATE: {
-        "required": ["WEAVIATE_URL", "WEAVIATE_API_KEY"],
-        "optional": [],
-        "packages": [
-            _PkgSpec("weaviate-client", "weaviate"),
-            _PkgSpec("langchain-weaviate")
-        ]
-    },
-    VectorDatabase.QDRANT: {
-        "required": ["QDRANT_URL"],
-        "optional": ["QDRANT_API_KEY"],
-        "packages": [
-            _PkgSpec("qdrant-client", "qdrant"),
-            _PkgSpec("langchain-qdrant")
-        ]
-    },
-    VectorDatabase.MILVUS: {
-        "required": ["MILVUS_HOST", "MILVUS_PORT"],
-        "optional": [],
-        "packages": [
-            _PkgSpec("pymilvus"),
-            _PkgSpec("langchain-milvus")
-        ]
-    },
-    VectorDatabase.PGVECTOR: {
-        "required": ["PGVECTOR_CONNECTION_STRING"],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-postgres"),
-            _PkgSpec("psycopg2-binary"),
-            _PkgSpec("pgvector")
-        ]
-    },
-    VectorDatabase.ELASTICSEARCH: {
-        "required": ["ELASTICSEARCH_URL"],
-        "optional": ["ELASTICSEARCH_API_KEY"],
-        "packages": [
-            _PkgSpec("elasticsearch"),
-            _PkgSpec("langchain-elasticsearch")
-        ]
-    },
-    VectorDatabase.CHROMA: {
-        "required": [],
-        "optional": [],
-        "packages": [
-            _PkgSpec("langchain-chroma"),
-            _PkgSpec("chromadb")
-        ]
-    },
-    VectorDatabase.FAISS: {
-        "required": [],
-        "optional": [],
-        "packages": [_PkgSpec("faiss-cpu")]
-    },
-    
-    # Document Loaders
-    ParserType.UNSTRUCTURED: {
-        "required": [],
-        "optional": [],
-        "packages": [_PkgSpec("unstructured"), _PkgSpec("nltk")]
-    },
-    ParserType.PYMUPDF: {
-        "required": [],
-        "optional": [],
-        "packages": [_PkgSpec("pymupdf")]
-    },
-    ParserType.PYPDF: {
-        "required": [],
-        "optional": [],
-        "packages": [_PkgSpec("pypdf")]
-    },
-    ParserType.DOCX: {
-        "required": [],
-        "optional": [],
-        "packages": [_PkgSpec("python-docx", "docx")]
-    },
-    ParserType.AZURE_BLOB: {
-        "required": ["AZURE_STORAGE_CONNECTION_STRING"],
-        "optional": [],
-        "packages": [_PkgSpec("azure-storage-blob")]
-    },
-    ParserType.S3: {
-        "required": ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"],
-        "optional": [],
-        "packages": [_PkgSpec("boto3")]
-    },
-    ParserType.WEB: {
-        "required": [],
-        "optional": [],
-        "packages": [
-            _PkgSpec("beautifulsoup4", "bs4"),
-            _PkgSpec("requests")
-        ]
-    },
-    
-    RetrieverType.BM25: {
-        "required": [],
-        "optional": [],
-        "packages": [_PkgSpec("rank-bm25")]
-    },
-
-    # Rerankers
-    RerankerType.COHERE: {
-        "required": ["COHERE_API_KEY"],
-        "optional": [],
-        "packages": [_PkgSpec("cohere")]
-    },
-    RerankerType.JINA: {
-        "required": ["JINA_API_KEY"],
-        "optional": [],
-        "packages": [_PkgSpec("jina")]
-    },
-    RerankerType.RANKLLM: {
-        "required": [],
-        "optional": [],
-        "packages": [_PkgSpec("rank-llm")]
-    },
-    RerankerType.MXBAI_LARGE: {
-        "required": [],
-        "optional": [],
-        "packages": [
-            _PkgSpec("torch"),
-            _PkgSpec("transformers")
-        ]
-    },
-    RerankerType.MXBAI_BASE: {
-        "required": [],
-        "optional": [],
-        "packages": [
-            _PkgSpec("torch"),
-            _PkgSpec("transformers")
-        ]
-    },
-    RerankerType.BGE_BASE: {
-        "required": [],
-        "optional": [],
-        "packages": [
-            _PkgSpec("torch"),
-            _PkgSpec("transformers")
-        ]
-    },
-    RerankerType.FLASH_RANK: {
-        "required": [],
-        "optional": [],
-        "packages": [_PkgSpec("flash-rank")]
+def _build_env_requirements():
+    return {
+        ParserType.UNSTRUCTURED: EnvReq(
+            required=(),
+            optional=(),
+            packages=(_PkgSpec("unstructured"), _PkgSpec("nltk"))
+        ),
+        # Embedding Models
+        EmbeddingType.AZURE_OPENAI: EnvReq(
+            required=("AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"),
+            optional=("AZURE_DEPLOYMENT_NAME",),
+            packages=(_PKG_LANGCHAIN_OPENAI, _PKG_OPENAI, _PKG_TIKTOKEN)
+        ),
+        EmbeddingType.OPENAI: EnvReq(
+            required=("OPENAI_API_KEY",),
+            optional=(),
+            packages=(_PKG_LANGCHAIN_OPENAI, _PKG_OPENAI, _PKG_TIKTOKEN)
+        ),
+        EmbeddingType.COHERE: EnvReq(required=("COHERE_API_KEY",), optional=(), packages=(_PKG_COHERE,)),
+        EmbeddingType.VERTEXAI: EnvReq(
+            required=("GOOGLE_APPLICATION_CREDENTIALS",),
+            optional=(),
+            packages=(_PKG_LANGCHAIN_VERTEXAI, _PKG_AIPLATFORM)
+        ),
+        EmbeddingType.BEDROCK: EnvReq(
+            required=("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"),
+            optional=(),
+            packages=(_PKG_BOTO3,)
+        ),
+        EmbeddingType.JINA: EnvReq(required=("JINA_API_KEY",), optional=(), packages=(_PKG_JINA,)),
+        EmbeddingType.HUGGINGFACE: EnvReq(
+            required=(),
+            optional=(),
+            packages=(_PKG_LANGCHAIN_HUGGINGFACE, _PKG_SENTENCE_TRANSFORMERS, _PKG_TORCH)
+        ),
+        EmbeddingType.OLLAMA: EnvReq(required=(), optional=(), packages=(_PKG_LANGCHAIN_OLLAMA, _PKG_OLLAMA)),
+        # Vector Databases
+        VectorDatabase.PINECONE: EnvReq(
+            required=("PINECONE_API_KEY", "PINECONE_ENVIRONMENT"),
+            optional=(),
+            packages=(_PkgSpec("langchain-pinecone", "langchain_pinecone"), _PkgSpec("pinecone-client", "pinecone"))
+        ),
+        VectorDatabase.WEAVIATE: EnvReq(
+            required=("WEAVIATE_URL", "WEAVIATE_API_KEY"),
+            optional=(),
+            packages=(_PkgSpec("weaviate-client", "weaviate"), _PkgSpec("langchain-weaviate", "langchain_weaviate"))
+        ),
+        VectorDatabase.QDRANT: EnvReq(
+            required=("QDRANT_URL",),
+            optional=("QDRANT_API_KEY",),
+            packages=(_PkgSpec("qdrant-client", "qdrant_client"), _PkgSpec("langchain-qdrant", "langchain_qdrant"))
+        ),
+        VectorDatabase.MILVUS: EnvReq(
+            required=("MILVUS_HOST", "MILVUS_PORT"),
+            optional=(),
+            packages=(_PkgSpec("pymilvus"), _PkgSpec("langchain-milvus", "langchain_milvus"))
+        ),
+        VectorDatabase.PGVECTOR: EnvReq(
+            required=("PGVECTOR_CONNECTION_STRING",),
+            optional=(),
+            packages=(_PkgSpec("langchain-postgres", "langchain_postgres"), _PkgSpec("psycopg2-binary", "psycopg2"), _PkgSpec("pgvector"))
+        ),
+        VectorDatabase.ELASTICSEARCH: EnvReq(
+            required=("ELASTICSEARCH_URL",),
+            optional=("ELASTICSEARCH_API_KEY",),
+            packages=(_PkgSpec("elasticsearch"), _PkgSpec("langchain-elasticsearch", "langchain_elasticsearch"))
+        ),
+        VectorDatabase.CHROMA: EnvReq(
+            required=(),
+            optional=(),
+            packages=(_PkgSpec("langchain-chroma", "langchain_chroma"), _PkgSpec("chromadb"))
+        ),
+        VectorDatabase.FAISS: EnvReq(required=(), optional=(), packages=(_PkgSpec("faiss-cpu", "faiss"),)),
+        # Document Loaders
+        ParserType.PYMUPDF: EnvReq(required=(), optional=(), packages=(_PkgSpec("pymupdf"),)),
+        ParserType.PYPDF: EnvReq(required=(), optional=(), packages=(_PkgSpec("pypdf"),)),
+        ParserType.DOCX: EnvReq(required=(), optional=(), packages=(_PkgSpec("python-docx", "docx"),)),
+        ParserType.AZURE_BLOB: EnvReq(
+            required=("AZURE_STORAGE_CONNECTION_STRING",),
+            optional=(),
+            packages=(_PkgSpec("azure-storage-blob", "azure.storage.blob"),)
+        ),
+        ParserType.S3: EnvReq(
+            required=("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"),
+            optional=(),
+            packages=(_PKG_BOTO3,)
+        ),
+        ParserType.WEB: EnvReq(
+            required=(),
+            optional=(),
+            packages=(_PkgSpec("beautifulsoup4", "bs4"), _PkgSpec("requests"))
+        ),
+        RetrieverType.BM25: EnvReq(required=(), optional=(), packages=(_PkgSpec("rank-bm25", "rank_bm25"),)),
+        # Rerankers
+        RerankerType.RANKLLM: EnvReq(required=(), optional=(), packages=(_PkgSpec("rank-llm", "rank_llm"),)),
+        RerankerType.MXBAI_LARGE: EnvReq(required=(), optional=(), packages=(_PKG_TORCH, _PKG_TRANSFORMERS)),
+        RerankerType.MXBAI_BASE: EnvReq(required=(), optional=(), packages=(_PKG_TORCH, _PKG_TRANSFORMERS)),
+        RerankerType.BGE_BASE: EnvReq(required=(), optional=(), packages=(_PKG_TORCH, _PKG_TRANSFORMERS)),
+        RerankerType.FLASH_RANK: EnvReq(required=(), optional=(), packages=(_PkgSpec("flash-rank", "flashrank"),)),
     }
-}
\ No newline at end of file
+# PEP 562: materialize the maps lazily on first attribute access, then cache
+# them in module globals so subsequent lookups are plain attribute loads.
+_LAZY_ATTRS = {
+    "LLM_MAP": _build_llm_map,
+    "LOADER_MAP": _build_loader_map,
+    "CHUNKER_MAP": _build_chunker_map,
+    "EMBEDDING_MAP": _build_embedding_map,
+    "VECTORDB_MAP": _build_vectordb_map,
+    "RETRIEVER_MAP": _build_retriever_map,
+    "RERANKER_MAP": _build_reranker_map,
+    "COMPONENT_ENV_REQUIREMENTS": _build_env_requirements,
+}
+
+def __getattr__(name):
+    builder = _LAZY_ATTRS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+__all__ = [
+    "GraphType",
+    "LLMType",
+    "ParserType",
+    "ChunkingStrategy",
+    "NO_CHUNK_SIZE_STRATEGIES",
+    "EmbeddingType",
+    "VectorDatabase",
+    "RetrieverType",
+    "RerankerType",
+    "EvaluatorType",
+    "lazy_load",
+    "LLM_MAP",
+    "LOADER_MAP",
+    "CHUNKER_MAP",
+    "EMBEDDING_MAP",
+    "VECTORDB_MAP",
+    "RETRIEVER_MAP",
+    "RERANKER_MAP",
+    "COMPONENT_ENV_REQUIREMENTS",
+    "EnvReq",
+    "TORCH_DTYPE_MAP",
+]
@@ -1,6 +1,5 @@
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from typing import List, Optional, Union, Dict, Any
-import yaml
 from ragbuilder.config.components import (
     ParserType, 
     ChunkingStrategy, 
@@ -10,39 +9,58 @@ from ragbuilder.config.components import (
     GraphType
 )
 from .base import (
-    OptimizationConfig, 
-    EvaluationConfig, 
-    ConfigMetadata, 
-    EvalDataGenerationConfig, 
-    LLMConfig, 
-    EmbeddingConfig
+    OptimizationConfig,
+    EvaluationConfig,
+    ConfigMetadata,
+    EvalDataGenerationConfig,
+    LLMConfig,
+    EmbeddingConfig,
+    _read_yaml
 )
 from ragbuilder.core.config_store import ConfigStore
 
 class LoaderConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: ParserType
     loader_kwargs: Optional[Dict[str, Any]] = None
     custom_class: Optional[str] = None
 
 class ChunkingStrategyConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: ChunkingStrategy
     chunker_kwargs: Optional[Dict[str, Any]] = None
     custom_class: Union[str, Any] = None
 
 class ChunkSizeConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     min: int = Field(default=500, description="Minimum chunk size")
     max: int = Field(default=3000, description="Maximum chunk size")
     stepsize: int = Field(default=500, description="Step size for chunk size")
 
 class ChunkSizeStatic(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     val: int = Field(default=500, description="chunk size")
     
 
 class VectorDBConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: VectorDatabase
     vectordb_kwargs: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Vector database specific configuration parameters")
     custom_class: Optional[str] = None
 
+# Shared pre-validated defaults. Loader and chunking entries are frozen and
+# carry no mutable kwargs, so one instance can back every config that falls
+# back to defaults. Vector DB and embedding defaults keep per-call
+# construction: their kwargs dicts get mutated per trial (e.g.
+# persist_directory) and must not be shared.
+_DEFAULT_LOADERS = (LoaderConfig(type=ParserType.UNSTRUCTURED),)
+_DEFAULT_CHUNKING_STRATEGIES = (ChunkingStrategyConfig(type=ChunkingStrategy.RECURSIVE),)
+
 class GraphConfig(BaseModel):
     type: GraphType #neo4j
     document_loaders: Optional[LoaderConfig] = Field(default=None, description="Loader strategy")
@@ -90,10 +108,10 @@ class DataIngestOptionsConfig(BaseModel):
             self.embedding_models = [ConfigStore().get_default_embeddings()]
 
         if self.document_loaders is None:
-            self.document_loaders = [LoaderConfig(type=ParserType.UNSTRUCTURED)]
+            self.document_loaders = list(_DEFAULT_LOADERS)
 
         if self.chunking_strategies is None:
-            self.chunking_strategies = [ChunkingStrategyConfig(type=ChunkingStrategy.RECURSIVE)]
+            self.chunking_strategies = list(_DEFAULT_CHUNKING_STRATEGIES)
 
         if self.chunk_size is None:
             self.chunk_size = ChunkSizeConfig()
@@ -139,8 +157,8 @@ class DataIngestOptionsConfig(BaseModel):
         """
         return cls(
             input_source=input_source,
-            document_loaders=[LoaderConfig(type=ParserType.UNSTRUCTURED)],
-            chunking_strategies=[ChunkingStrategyConfig(type=ChunkingStrategy.RECURSIVE)],
+            document_loaders=list(_DEFAULT_LOADERS),
+            chunking_strategies=list(_DEFAULT_CHUNKING_STRATEGIES),
             chunk_size=ChunkSizeConfig(
                 min=500,
                 max=3000,
@@ -190,26 +208,62 @@ class DataIngestConfig(BaseModel):
     vector_database: VectorDBConfig
     sampling_rate: Optional[float] = None
 
+# Keys that only appear in the options (search space) config, used to dispatch
+# without paying for a failed validation pass of the wrong model.
+_OPTIONS_ONLY_KEYS = frozenset({
+    "document_loaders",
+    "chunking_strategies",
+    "embedding_models",
+    "vector_databases",
+    "optimization"
+})
+
 def load_config(file_path: str) -> Union[DataIngestOptionsConfig, DataIngestConfig]:
-    with open(file_path, 'r') as file:
-        config_dict = yaml.safe_load(file)
-    
+    # JSON snapshots skip the YAML parse and validate straight from bytes
+    if str(file_path).endswith('.json'):
+        with open(file_path, 'rb') as file:
+            raw = file.read()
+        try:
+            return DataIngestOptionsConfig.model_validate_json(raw)
+        except ValidationError:
+            try:
+                return DataIngestConfig.model_validate_json(raw)
+            except ValidationError as e:
+                raise ValueError(f"Invalid configuration: {str(e)}")
+
+    config_dict = _read_yaml(file_path)
+
     # Check for required fields
     if 'input_source' not in config_dict or 'test_dataset' not in config_dict:
         raise ValueError("Configuration must include 'input_source' and 'test_data'")
-    
-    # TODO: Re-think and redo this logic to see if there's a better way
+
+    # Cheap key-shape check: only fall back to try/except validation on ambiguity
+    if _OPTIONS_ONLY_KEYS.intersection(config_dict):
+        try:
+            return DataIngestOptionsConfig.model_validate(config_dict)
+        except ValidationError:
+            # A singular config can carry stray options-only keys (pydantic
+            # ignores extras), so still try the singular model before giving up
+            try:
+                return DataIngestConfig.model_validate(config_dict)
+            except ValidationError as e:
+                raise ValueError(f"Invalid configuration: {str(e)}")
+
     try:
-        return DataIngestOptionsConfig(**config_dict)
+        return DataIngestConfig.model_validate(config_dict)
     except ValidationError:
-        # If it fails, try DataIngestConfig
+        # If it fails, try DataIngestOptionsConfig
         try:
-            return DataIngestConfig(**config_dict)
+            return DataIngestOptionsConfig.model_validate(config_dict)
         except ValidationError as e:
             raise ValueError(f"Invalid configuration: {str(e)}")
 
 def save_config(config: Union[DataIngestOptionsConfig, DataIngestConfig], file_path: str) -> None:
     """
-    Save configuration to a YAML file.
+    Save configuration to a YAML file, or JSON when the path ends in .json.
     """
-    config.to_yaml(file_path)
\ No newline at end of file
+    if str(file_path).endswith('.json'):
+        with open(file_path, 'w') as file:
+            file.write(config.model_dump_json(indent=2))
+    else:
+        config.to_yaml(file_path)
\ No newline at end of file
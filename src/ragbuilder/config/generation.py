@@ -2,7 +2,7 @@ from typing import Optional, List, Any
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 import pandas as pd
 from ragbuilder.config.components import lazy_load, LLMType
-from ragbuilder.config.base import ConfigMetadata, LLMConfig
+from ragbuilder.config.base import ConfigMetadata, LLMConfig, YamlDumper, _read_yaml
 from ragbuilder.core.config_store import ConfigStore
 from .base import OptimizationConfig, EvaluationConfig, ConfigMetadata
 from .components import EvaluatorType
@@ -75,14 +75,29 @@ class BaseConfig(BaseModel):
     
     @classmethod
     def from_yaml(cls, file_path: str) -> "GenerationOptionsConfig":
-        with open(file_path, "r") as yaml_file:
-            config = yaml.safe_load(yaml_file)
-        return cls(**config["generation"])
+        config = _read_yaml(file_path)
+        return cls.model_validate(config["generation"])
 
     def to_yaml(self, file_path: str) -> None:
         """Save configuration to a YAML file."""
+        # mode="json" renders enums/paths as plain scalars the safe loader can read back
         with open(file_path, 'w') as file:
-            yaml.dump(self.model_dump(), file)
+            yaml.dump(self.model_dump(mode="json"), file, Dumper=YamlDumper, sort_keys=False)
+
+    @classmethod
+    def from_json(cls, file_path: str) -> "BaseConfig":
+        """Load configuration from a JSON file (fast path for internal snapshots)."""
+        with open(file_path, 'rb') as file:
+            return cls.model_validate_json(file.read())
+
+    def to_json(self, file_path: str) -> None:
+        """Save configuration to a JSON file.
+
+        Serializes via pydantic-core directly, skipping the YAML emitter —
+        preferred for machine-written snapshots between optimization stages.
+        """
+        with open(file_path, 'w') as file:
+            file.write(self.model_dump_json(indent=2))
 
 class GenerationConfig(BaseConfig):
     llm: LLMConfig
@@ -1,7 +1,6 @@
 from pydantic import BaseModel, Field, ValidationError
-from typing import List, Optional, Dict, Any, Union
-import yaml
-from .base import OptimizationConfig, EvaluationConfig, ConfigMetadata
+from typing import List, Literal, Optional, Dict, Any, Union
+from .base import OptimizationConfig, EvaluationConfig, ConfigMetadata, _read_yaml
 from .components import RetrieverType, RerankerType, EvaluatorType
 from ragbuilder.core.config_store import ConfigStore
 
@@ -21,6 +20,10 @@ class RerankerConfig(BaseModel):
     type: RerankerType
     reranker_kwargs: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Re-ranker-specific parameters")
     custom_class: Optional[str] = None
+    dtype: Optional[Literal["fp32", "fp16", "bf16"]] = Field(
+        default=None,
+        description="Model precision for local cross-encoder rerankers (None uses the model default)"
+    )
 
 class RetrievalOptionsConfig(BaseModel):
     """Configuration for retriever optimization options"""
@@ -101,25 +104,40 @@ class RetrievalConfig(BaseModel):
     top_k: int
 
 def load_config(file_path: str) -> Union[RetrievalOptionsConfig, BaseRetrieverConfig]:
-    with open(file_path, 'r') as file:
-        config_dict = yaml.safe_load(file)
-    
+    # JSON snapshots skip the YAML parse and validate straight from bytes
+    if str(file_path).endswith('.json'):
+        with open(file_path, 'rb') as file:
+            raw = file.read()
+        try:
+            return RetrievalOptionsConfig.model_validate_json(raw)
+        except ValidationError:
+            try:
+                return BaseRetrieverConfig.model_validate_json(raw)
+            except ValidationError as e:
+                raise ValueError(f"Invalid configuration: {str(e)}")
+
+    config_dict = _read_yaml(file_path)
+
     # Check for required fields
     if 'retriever' not in config_dict or 'reranker' not in config_dict:
         raise ValueError("Configuration must include 'retriever' and 'reranker'")
     
     # TODO: Re-think and redo this logic to see if there's a better way
     try:
-        return RetrievalOptionsConfig(**config_dict)
+        return RetrievalOptionsConfig.model_validate(config_dict)
     except ValidationError:
         # If it fails, try RetrieverConfig
         try:
-            return BaseRetrieverConfig(**config_dict)
+            return BaseRetrieverConfig.model_validate(config_dict)
         except ValidationError as e:
             raise ValueError(f"Invalid configuration: {str(e)}")
 
 def save_config(config: Union[RetrievalOptionsConfig, BaseRetrieverConfig], file_path: str) -> None:
     """
-    Save configuration to a YAML file.
+    Save configuration to a YAML file, or JSON when the path ends in .json.
     """
-    config.to_yaml(file_path)
\ No newline at end of file
+    if str(file_path).endswith('.json'):
+        with open(file_path, 'w') as file:
+            file.write(config.model_dump_json(indent=2))
+    else:
+        config.to_yaml(file_path)
\ No newline at end of file
@@ -10,7 +10,7 @@ from langchain_community.document_loaders import (
 )
 # from langchain_unstructured import UnstructuredLoader
 from langchain_core.documents import Document
-from ragbuilder.config.components import COMPONENT_ENV_REQUIREMENTS, ParserType
+from ragbuilder.config.components import COMPONENT_ENV_REQUIREMENTS, EnvReq, ParserType
 from ragbuilder.config.data_ingest import DataIngestOptionsConfig
 from ragbuilder.config.retriever import RetrievalOptionsConfig
 import json
@@ -173,11 +173,11 @@ def validate_component_env(component_value: str) -> Tuple[List[str], List[str]]:
     Returns:
         List of missing required environment variables and packages
     """
-    requirements = COMPONENT_ENV_REQUIREMENTS.get(component_value, {"required": [], "optional": [], "packages": []})
+    requirements = COMPONENT_ENV_REQUIREMENTS.get(component_value, EnvReq())
     missing_env = []
     missing_packages = []
-    missing_env.extend([var for var in requirements["required"] if not os.getenv(var)])
-    missing_packages.extend([pkg_name for pkg in requirements.get("packages", []) 
+    missing_env.extend([var for var in requirements.required if not os.getenv(var)])
+    missing_packages.extend([pkg_name for pkg in requirements.packages
                            if (pkg_name := pkg.validate())])
     
     if component_value == ParserType.UNSTRUCTURED:
@@ -9,7 +9,7 @@ from langchain.retrievers import ContextualCompressionRetriever, MultiQueryRetri
 from langchain.retrievers.document_compressors import DocumentCompressorPipeline
 # from rerankers import Reranker
 
-from ragbuilder.config.components import RetrieverType, RerankerType, RERANKER_MAP, CHUNKER_MAP
+from ragbuilder.config.components import RetrieverType, RerankerType, RERANKER_MAP, CHUNKER_MAP, TORCH_DTYPE_MAP
 from ragbuilder.config.retriever import RetrievalConfig, RerankerConfig
 from ragbuilder.core.logging_utils import console, setup_rich_logging
 from ragbuilder.core.document_store import DocumentStore
@@ -248,7 +248,11 @@ class RetrieverPipeline:
                 if k not in config.reranker_kwargs and k != 'lazy_load'
             }
             merged_kwargs.update(config.reranker_kwargs)  # Add/override with user configs
-            
+
+            # Run local cross-encoders at reduced precision when requested
+            if config.dtype and merged_kwargs.get('model_type') in ('cross-encoder', 'TransformerRanker', 'ColBERTRanker'):
+                merged_kwargs.setdefault('dtype', TORCH_DTYPE_MAP[config.dtype])
+
             # Create reranker with merged config
             ranker = Reranker(
                 config.type.value,  # model name/path
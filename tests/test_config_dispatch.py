@@ -0,0 +1,77 @@
+"""
+Tests for load_config dispatch between options and singular data-ingest configs
+"""
+
+import os
+import tempfile
+import unittest
+import yaml
+from ragbuilder.config.data_ingest import (
+    DataIngestConfig,
+    DataIngestOptionsConfig,
+    load_config
+)
+
+class TestLoadConfigDispatch(unittest.TestCase):
+    """Test that load_config picks the right config model for a YAML file"""
+
+    def _load(self, config_dict):
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as file:
+            yaml.safe_dump(config_dict, file)
+            path = file.name
+        try:
+            return load_config(path)
+        finally:
+            os.remove(path)
+
+    def test_options_config(self):
+        """Options-only keys dispatch to DataIngestOptionsConfig"""
+        config = self._load({
+            "input_source": "docs/",
+            "test_dataset": "test.csv",
+            "document_loaders": [{"type": "unstructured"}],
+            "chunking_strategies": [{"type": "RecursiveCharacterTextSplitter"}]
+        })
+        self.assertIsInstance(config, DataIngestOptionsConfig)
+
+    def test_singular_config(self):
+        """A fully-specified singular config loads as DataIngestConfig"""
+        config = self._load({
+            "input_source": "docs/",
+            "test_dataset": "test.csv",
+            "document_loader": {"type": "unstructured"},
+            "chunking_strategy": {"type": "RecursiveCharacterTextSplitter"},
+            "chunk_size": 1000,
+            "chunk_overlap": 100,
+            "embedding_model": {"type": "huggingface"},
+            "vector_database": {"type": "chroma"}
+        })
+        self.assertIsInstance(config, DataIngestConfig)
+
+    def test_singular_config_with_stray_options_key(self):
+        """A singular config with a stray options-only key still loads as DataIngestConfig"""
+        config = self._load({
+            "input_source": "docs/",
+            "test_dataset": "test.csv",
+            "document_loader": {"type": "unstructured"},
+            "chunking_strategy": {"type": "RecursiveCharacterTextSplitter"},
+            "chunk_size": 1000,
+            "chunk_overlap": 100,
+            "embedding_model": {"type": "huggingface"},
+            "vector_database": {"type": "chroma"},
+            "optimization": {"n_trials": 5}
+        })
+        self.assertIsInstance(config, DataIngestConfig)
+
+    def test_invalid_config_raises(self):
+        """A config that fits neither model raises ValueError"""
+        with self.assertRaises(ValueError):
+            self._load({
+                "input_source": "docs/",
+                "test_dataset": "test.csv",
+                "chunking_strategies": "not-a-list",
+                "chunk_size": "not-an-int"
+            })
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests for the kwargs EmbeddingConfig builds for embedding providers
+"""
+
+import unittest
+from ragbuilder.config.base import EmbeddingConfig
+from ragbuilder.config.components import EmbeddingType
+
+class TestEmbeddingKwargs(unittest.TestCase):
+    """Test that EmbeddingConfig builds provider kwargs correctly"""
+
+    def test_huggingface_default_batch_size(self):
+        """HuggingFace gets a default encode batch size of 64"""
+        config = EmbeddingConfig(type=EmbeddingType.HUGGINGFACE)
+        kwargs = config._build_kwargs()
+        self.assertEqual(kwargs["encode_kwargs"]["batch_size"], 64)
+
+    def test_huggingface_explicit_batch_size_wins(self):
+        """An encode_kwargs batch_size set by the user is not overridden"""
+        config = EmbeddingConfig(
+            type=EmbeddingType.HUGGINGFACE,
+            model_kwargs={"encode_kwargs": {"batch_size": 16}},
+            batch_size=128
+        )
+        kwargs = config._build_kwargs()
+        self.assertEqual(kwargs["encode_kwargs"]["batch_size"], 16)
+
+    def test_openai_keeps_provider_batch_default(self):
+        """OpenAI gets no chunk_size unless batch_size is explicitly set"""
+        config = EmbeddingConfig(type=EmbeddingType.OPENAI)
+        self.assertNotIn("chunk_size", config._build_kwargs())
+
+    def test_openai_explicit_batch_size(self):
+        """An explicit batch_size flows to OpenAI as chunk_size"""
+        config = EmbeddingConfig(type=EmbeddingType.OPENAI, batch_size=256)
+        self.assertEqual(config._build_kwargs()["chunk_size"], 256)
+
+    def test_huggingface_dtype_nesting(self):
+        """torch_dtype lands in the inner model_kwargs SentenceTransformer forwards to transformers"""
+        config = EmbeddingConfig(type=EmbeddingType.HUGGINGFACE, dtype="fp16")
+        kwargs = config._build_kwargs()
+        self.assertNotIn("torch_dtype", kwargs["model_kwargs"])
+        self.assertEqual(kwargs["model_kwargs"]["model_kwargs"]["torch_dtype"], "float16")
+
+    def test_huggingface_dtype_preserves_user_kwargs(self):
+        """Existing model kwargs survive the dtype merge and user dtype wins"""
+        config = EmbeddingConfig(
+            type=EmbeddingType.HUGGINGFACE,
+            model_kwargs={"model_kwargs": {"device": "cpu", "model_kwargs": {"torch_dtype": "bfloat16"}}},
+            dtype="fp16"
+        )
+        kwargs = config._build_kwargs()
+        self.assertEqual(kwargs["model_kwargs"]["device"], "cpu")
+        self.assertEqual(kwargs["model_kwargs"]["model_kwargs"]["torch_dtype"], "bfloat16")
+
+if __name__ == "__main__":
+    unittest.main()